@@ -5,14 +5,60 @@ argument and returns None when successful.  When a check fails, it should throw
 an Exception with a helpful error message.  These exception messages will be
 caught and organized by the cli audit tool.
 """
+import functools
 import inspect
-from typing import Callable, Optional
+import operator
+from collections.abc import Iterable, Iterator
+from typing import Any, Callable, Optional
 
-from jinja2 import DebugUndefined, Environment, meta
+from jinja2 import DebugUndefined, Environment, Template, meta
 
 from happi import SearchResult
 
-CLIENT_KEYS = ['_id', 'type', 'creation', 'last_edit']
+CLIENT_KEYS: frozenset[str] = frozenset(
+    ('_id', 'type', 'creation', 'last_edit')
+)
+
+# Shared environment used to pick out jinja-like templates in documents
+_JINJA_ENV = Environment(undefined=DebugUndefined)
+
+
+def _iter_template_strings(value: Any) -> Iterator[str]:
+    """Yield the jinja-like template strings found anywhere in ``value``."""
+    if isinstance(value, str):
+        if '{{' in value or '{%' in value:
+            yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_template_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_template_strings(item)
+
+
+@functools.lru_cache(maxsize=None)
+def _attrs_getter(names: tuple[str, ...]) -> Callable[[Any], tuple]:
+    """Return (and remember) a getter of the tuple of ``names`` attributes."""
+    if len(names) > 1:
+        return operator.attrgetter(*names)
+    if names:
+        getter = operator.attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    return lambda obj: ()
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_template(source: str) -> Template:
+    """Compile (and remember) the template for ``source``."""
+    return _JINJA_ENV.from_string(source)
+
+
+@functools.lru_cache(maxsize=1024)
+def _find_undeclared_variables(source: str) -> frozenset[str]:
+    """Return the variables ``source`` uses without defining them."""
+    return frozenset(
+        meta.find_undeclared_variables(_JINJA_ENV.parse(source))
+    )
 
 
 def check_instantiation(result: SearchResult) -> None:
@@ -28,7 +74,7 @@ def check_instantiation(result: SearchResult) -> None:
 
 def check_extra_info(
     result: SearchResult,
-    ignore_keys: Optional[list[str]] = None
+    ignore_keys: Optional[Iterable[str]] = None
 ) -> None:
     """
     Check if there is any extra info in the result that does not
@@ -40,14 +86,10 @@ def check_extra_info(
     - creation
     - last_edit
     """
-    if ignore_keys is None:
-        ignore_keys = CLIENT_KEYS
-
-    extra = result.item.extraneous.copy()
-    for key in ignore_keys:
-        extra.pop(key, None)
-    if len(extra) != 0:
-        raise ValueError(f'Un-enforced metadata found: {list(extra.keys())}')
+    ignore = CLIENT_KEYS if ignore_keys is None else frozenset(ignore_keys)
+    extra_keys = [key for key in result.item.extraneous if key not in ignore]
+    if extra_keys:
+        raise ValueError(f'Un-enforced metadata found: {extra_keys}')
 
 
 def check_name_match_id(result: SearchResult) -> None:
@@ -79,10 +121,12 @@ def check_wait_connection(result: SearchResult) -> None:
         dev.wait_for_connection(timeout=5)
     except TimeoutError as te:
         # If we encounter a timeout error, gather some more detailed stats
-        sigs = list(sig.item for sig in dev.walk_signals())
-        conn_sigs = sum(sig.connected for sig in sigs)
+        n_sigs, conn_sigs = 0, 0
+        for sig in dev.walk_signals():
+            n_sigs += 1
+            conn_sigs += bool(sig.item.connected)
 
-        raise ValueError(f'{conn_sigs}/{len(sigs)} signals connected. \n'
+        raise ValueError(f'{conn_sigs}/{n_sigs} signals connected. \n'
                          f'original error: {te}')
 
 
@@ -94,20 +138,19 @@ def check_args_kwargs_match(result: SearchResult) -> None:
     i.e.: makes sure there is information in the entry named "extra"
           if the kwargs = {'extra': '{{extra}}'}
     """
-    # Happi fills in values when search result is created, must pull
-    # raw document from client level
-    cl = result.client
-    doc = cl.find_document(**{cl._id_key: result[cl._id_key]})
-    # pick out any jinja-like template
-    env = Environment(undefined=DebugUndefined)
-
-    # render template and check if any variables were undefined
-    template = env.from_string(str(doc))
-    rendered = template.render(**doc)
-    undefined = meta.find_undeclared_variables(env.parse(rendered))
+    # Happi fills in values when search result is created, must check
+    # the raw document
+    doc = result.raw_document
+    # render each template and check if any variables were undefined
+    undefined = set()
+    for source in _iter_template_strings(doc):
+        rendered = _compile_template(source).render(**doc)
+        undefined.update(_find_undeclared_variables(rendered))
 
     if len(undefined) != 0:
-        raise ValueError(f'undefined variables found in document: {undefined}')
+        raise ValueError(
+            f'undefined variables found in document: {undefined}'
+        )
 
 
 def find_unfilled_mandatory_info(
@@ -116,8 +159,9 @@ def find_unfilled_mandatory_info(
     """
     Return all mandatory fields that are missing a value
     """
-    return [info for info in result.item.mandatory_info
-            if getattr(result.item, info) is None]
+    names = tuple(result.item.mandatory_info)
+    values = _attrs_getter(names)(result.item)
+    return [info for info, value in zip(names, values) if value is None]
 
 
 def find_unfilled_optional_info(
@@ -126,11 +170,14 @@ def find_unfilled_optional_info(
     """
     Return all optional fields that are missing a value
     """
+    item = result.item
+    mandatory = frozenset(item.mandatory_info)
+    extraneous = item.extraneous
     # cannot getattr for extraneous info, shortcircuit conditional
-    return [info for info in list(result.item.keys())
-            if info not in result.item.mandatory_info
-            and info not in result.item.extraneous.keys()
-            and getattr(result.item, info) is None]
+    return [info for info in item.keys()
+            if info not in mandatory
+            and info not in extraneous
+            and getattr(item, info) is None]
 
 
 def check_unfilled_mandatory_info(result: SearchResult) -> None:
@@ -146,6 +193,30 @@ def check_unfilled_mandatory_info(result: SearchResult) -> None:
         raise ValueError(f'unfilled mandatory information found: {unfilled_info}')
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_signature_of(check: Callable) -> inspect.Signature:
+    """Return (and remember) the signature of ``check``."""
+    return inspect.signature(check)
+
+
+def _signature_of(check: Callable) -> inspect.Signature:
+    """Return the signature of ``check``, remembering it if hashable."""
+    try:
+        return _cached_signature_of(check)
+    except TypeError:
+        # Callables defining __eq__ without __hash__ can not be remembered
+        return inspect.signature(check)
+
+
+def _is_builtin_check(check: Callable) -> bool:
+    """Whether ``check`` is one of the built-in checks."""
+    try:
+        return check in _BUILTIN_CHECKS
+    except TypeError:
+        # Unhashable, so not one of the (hashable) built-in functions
+        return False
+
+
 def verify_result(
     result: SearchResult,
     check: Callable[[SearchResult], None]
@@ -173,9 +244,9 @@ def verify_result(
         to fix.  Empty string if validation is successful
     """
     success, msg = True, ""
-    # verify checks have the correct signature, as much as is reasonable
-    sig = inspect.signature(check)
-    sig.bind(result)
+    if not _is_builtin_check(check):
+        # verify checks have the correct signature, as much as is reasonable
+        _signature_of(check).bind(result)
 
     try:
         check(result)
@@ -186,6 +257,17 @@ def verify_result(
     return success, check.__name__, msg
 
 
-checks = [check_instantiation, check_extra_info, check_name_match_id,
-          check_wait_connection, check_args_kwargs_match,
-          check_unfilled_mandatory_info]
+# Built-in checks, by name
+checks: dict[str, Callable[[SearchResult], None]] = {
+    fn.__name__: fn for fn in (
+        check_instantiation, check_extra_info, check_name_match_id,
+        check_wait_connection, check_args_kwargs_match,
+        check_unfilled_mandatory_info,
+    )
+}
+# Built-in checks all take a single result, so need no signature check
+_BUILTIN_CHECKS = frozenset(checks.values())
+
+# Checks that spend their time waiting on device creation and connection,
+# and so may be run on several results at once
+io_bound_checks = [check_instantiation, check_wait_connection]
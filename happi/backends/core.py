@@ -1,8 +1,9 @@
 """
 Base backend database options.
 """
+import contextlib
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,19 @@ class _Backend:
         Optional implementation may be customized in subclass.
         """
 
+    @contextlib.contextmanager
+    def batch_context(self) -> Iterator[None]:
+        """
+        Context manager grouping several modifications into one write.
+
+        Backends that write their whole database on every modification may
+        defer writing until the block exits.  The base implementation writes
+        each modification immediately.
+
+        Optional implementation may be customized in subclass.
+        """
+        yield
+
     def find(self, multiples: bool = False, **kwargs) -> ItemMetaGen:
         """
         Find an instance or instances that matches the search criteria.
@@ -1,5 +1,6 @@
 """
-Backend implemenation using the ``simplejson`` package.
+Backend implemenation using the ``orjson`` package, falling back to
+``simplejson`` where ``orjson`` is unavailable.
 """
 import contextlib
 import getpass
@@ -11,10 +12,16 @@ import re
 import shutil
 import time
 import uuid
+from collections.abc import Iterator
 from typing import Any, Callable, Optional, Union
 
 import simplejson as json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .. import utils
 from ..errors import DuplicateError, SearchError
 from .core import ItemMeta, ItemMetaGen, _Backend
@@ -25,12 +32,93 @@ logger = logging.getLogger(__name__)
 _MISSING = object()
 
 
+def _loads(raw: bytes) -> dict[str, ItemMeta]:
+    """
+    Deserialize the raw contents of a JSON database file.
+
+    ``orjson`` reads integers beyond the 64-bit range as floats, where
+    ``simplejson`` keeps them as integers.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def _dumps(db: dict[str, ItemMeta]) -> bytes:
+    """
+    Serialize a database to sorted, indented JSON bytes.
+
+    The output of ``orjson`` and ``simplejson`` is the same, except for
+    floats written in exponent notation: ``orjson`` writes ``1e16`` and
+    ``1e-7`` where ``simplejson`` writes ``1e+16`` and ``1e-07``.  Both
+    read back as the same values.  Databases that ``orjson`` can not
+    serialize, such as those holding integers beyond the 64-bit range, are
+    written with ``simplejson``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                db,
+                option=(orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+                        | orjson.OPT_NON_STR_KEYS
+                        | orjson.OPT_APPEND_NEWLINE),
+            )
+        except orjson.JSONEncodeError:
+            ...
+    # Match the output of orjson, so the file format does not depend on it
+    payload = json.dumps(db, sort_keys=True, indent=2, ensure_ascii=False)
+    return (payload + '\n').encode('utf-8')
+
+
 @contextlib.contextmanager
 def _load_and_store_context(backend):
     """Context manager used to load, and optionally store the JSON database."""
     db = backend._load_or_initialize()
-    yield db
-    backend.store(db)
+    if backend._batch_db is not None:
+        # Inside ``batch_context``: the database is written when it exits
+        try:
+            yield db
+        except BaseException:
+            # As below; the batch itself still holds the database to store
+            backend._discard_unstored()
+            raise
+        finally:
+            backend._by_key = {}
+        backend._batch_dirty = True
+        return
+
+    try:
+        yield db
+        backend.store(db)
+    except BaseException:
+        # The in-memory database may have been modified without being
+        # written; load it again from the file when next used.
+        backend._discard_unstored()
+        raise
+
+
+def _matches_all(doc: ItemMeta, items: tuple[tuple[str, Any], ...]) -> bool:
+    """Whether ``doc`` has each ``(key, value)`` pair of ``items``."""
+    for key, value in items:
+        if value != doc.get(key, _MISSING):
+            return False
+    return True
+
+
+def _is_hashable(value: Any) -> bool:
+    """Whether ``value`` can be used as a key of an index."""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _stat_key(path: str) -> tuple[int, int, int]:
+    """A key identifying the current on-disk version of ``path``."""
+    stat = os.stat(path)
+    # ``store`` replaces the file, so the inode changes on every write
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
 
 
 class JSONBackend(_Backend):
@@ -38,7 +126,8 @@ class JSONBackend(_Backend):
     JSON database.
 
     The happi information is kept in a single large dictionary that is stored
-    using the ``simplejson`` package.
+    using the ``orjson`` package (or ``simplejson``, if ``orjson`` is not
+    installed).
 
     Parameters
     ----------
@@ -50,6 +139,15 @@ class JSONBackend(_Backend):
         Path to the happi config.
     """
 
+    # Database being modified inside ``batch_context``, and whether it has
+    # changes that still need to be stored.  Defaults live on the class, as
+    # subclasses such as ``QSBackend`` do not call ``__init__``.
+    _batch_db: Optional[dict[str, ItemMeta]] = None
+    _batch_dirty: bool = False
+    # The database the indices in ``_by_key`` were built for.  While this
+    # is not the current database, ``_by_key`` is reset before being used.
+    _index_db: Optional[dict[str, ItemMeta]] = None
+
     def __init__(
         self,
         path: str,
@@ -57,6 +155,13 @@ class JSONBackend(_Backend):
         cfg_path: Optional[str] = None
     ) -> None:
         self._load_cache: dict[str, ItemMeta] = None
+        # Raw file contents and the file version they were read from.  This
+        # survives ``clear_cache`` and is reused until the file changes.
+        self._raw_cache: Optional[bytes] = None
+        self._raw_cache_key: Optional[tuple[int, int, int]] = None
+        # Per-key indices of {value: [item ids]}, built lazily by ``find``
+        # for the database object held in ``_index_db``.
+        self._by_key: dict[str, dict[Any, list[str]]] = {}
         # Determine the cfg dir and build path to json db based on that unless we're initted w/o a config
         if cfg_path is not None:
             cfg_dir = os.path.dirname(cfg_path)
@@ -68,11 +173,25 @@ class JSONBackend(_Backend):
             self.initialize()
 
     def clear_cache(self) -> None:
-        """Clear the loaded cache."""
+        """
+        Clear the loaded cache.
+
+        The next access parses the database again, only re-reading the file
+        if it has been modified since it was last loaded or stored.
+        """
         self._load_cache = None
 
+    def _discard_unstored(self) -> None:
+        """Drop the loaded database, which may have unstored modifications."""
+        self._load_cache = None
+        self._by_key = {}
+        self._index_db = None
+
     def _load_or_initialize(self) -> Optional[dict[str, ItemMeta]]:
         """Load an existing database or initialize a new one."""
+        if self._batch_db is not None:
+            return self._batch_db
+
         if self._load_cache is None:
             try:
                 self._load_cache = self.load()
@@ -83,11 +202,44 @@ class JSONBackend(_Backend):
 
         return self._load_cache
 
+    @contextlib.contextmanager
+    def batch_context(self) -> Iterator[None]:
+        """
+        Context manager grouping several modifications into one write.
+
+        Inside the block, ``save`` and ``delete`` only modify the database in
+        memory, and reads see those modifications.  The database is stored
+        once, when the outermost block exits, including when it exits with
+        an exception so that modifications which succeeded are kept.
+        """
+        if self._batch_db is not None:
+            # Nested block; the outermost one does the writing
+            yield
+            return
+
+        self._batch_db = self._load_or_initialize()
+        self._batch_dirty = False
+        try:
+            yield
+        finally:
+            db, dirty = self._batch_db, self._batch_dirty
+            self._batch_db = None
+            self._batch_dirty = False
+            if dirty:
+                try:
+                    self.store(db)
+                except BaseException:
+                    # Do not serve the unwritten modifications from the cache
+                    self._discard_unstored()
+                    raise
+
     @property
     def all_items(self) -> list[ItemMeta]:
         """All of the items in the database."""
-        json = self._load_or_initialize()
-        return list(json.values())
+        db = self._load_or_initialize()
+        # A list rather than a view: ``save`` and ``delete`` modify the
+        # (cached) database in place, and callers may do so while iterating.
+        return list(db.values())
 
     def initialize(self):
         """
@@ -113,12 +265,21 @@ class JSONBackend(_Backend):
         self.store({})
 
     def load(self) -> dict[str, ItemMeta]:
-        """Load the JSON database."""
-        with open(self.path) as f:
-            raw_json = f.read()
+        """
+        Load the JSON database.
+
+        The file contents are cached, and are not read again for as long as
+        the file is unchanged on disk.  Each call returns a newly parsed
+        database.
+        """
+        key = _stat_key(self.path)
+        if self._raw_cache is None or key != self._raw_cache_key:
+            with open(self.path, 'rb') as f:
+                self._raw_cache = f.read()
+            self._raw_cache_key = key
 
         # Allow for empty files to be considered valid databases:
-        return json.loads(raw_json) if raw_json else {}
+        return _loads(self._raw_cache) if self._raw_cache else {}
 
     def store(self, db: dict[str, ItemMeta]) -> None:
         """
@@ -130,21 +291,30 @@ class JSONBackend(_Backend):
         2. Move the temporary file over the previous database.
 
         Step 2 is an atomic operation, ensuring that the database
-        does not get corrupted by an interrupted json.dump.
+        does not get corrupted by an interrupted write.  The database is
+        serialized before the temporary file is created, and the file is
+        flushed to disk before it is moved.
 
         Parameters
         ----------
         db : dict
             Dictionary to store in JSON.
         """
+        payload = _dumps(db)
         temp_path = self._temp_path()
 
-        with open(temp_path, 'w') as fd:
-            json.dump(db, fd, sort_keys=True, indent=4)
+        with open(temp_path, 'wb') as fd:
+            fd.write(payload)
+            fd.flush()
+            os.fsync(fd.fileno())
 
         if os.path.exists(self.path):
             shutil.copymode(self.path, temp_path)
-        shutil.move(temp_path, self.path)
+        os.replace(temp_path, self.path)
+        # What we just wrote is, by definition, the current file contents
+        self._raw_cache, self._raw_cache_key = payload, _stat_key(self.path)
+        # ``db`` may have been modified in place; rebuild indices on demand
+        self._by_key = {}
 
     def _temp_path(self) -> str:
         """
@@ -180,10 +350,42 @@ class JSONBackend(_Backend):
 
         for name, doc in db.items():
             try:
-                if comparison(name, doc):
-                    yield doc
+                matched = comparison(name, doc)
             except Exception as ex:
                 logger.debug('Comparison method failed: %s', ex, exc_info=ex)
+                continue
+
+            if matched:
+                yield doc
+
+    def _get_index(
+        self,
+        db: dict[str, ItemMeta],
+        key: str
+    ) -> dict[Any, list[str]]:
+        """
+        Get the index of ``key`` for ``db``, mapping value to item ids.
+
+        Ids are listed in database order.  Items with an unhashable value for
+        ``key`` are left out, as they cannot equal a hashable search value.
+        """
+        if self._index_db is not db:
+            self._by_key = {}
+            self._index_db = db
+
+        try:
+            return self._by_key[key]
+        except KeyError:
+            ...
+
+        index = {}
+        for name, doc in db.items():
+            value = doc.get(key, _MISSING)
+            if value is not _MISSING and _is_hashable(value):
+                index.setdefault(value, []).append(name)
+
+        self._by_key[key] = index
+        return index
 
     def get_by_id(self, id_: str) -> ItemMeta:
         """Get an item by ID if it exists, or return None."""
@@ -201,12 +403,28 @@ class JSONBackend(_Backend):
         """
 
         def comparison(name, doc):
-            return all(
-                value == doc.get(key, _MISSING)
-                for key, value in to_match.items()
-            )
+            return _matches_all(doc, items)
 
-        yield from self._iterative_compare(comparison)
+        items = tuple(to_match.items())
+        indexed = {
+            key: value for key, value in to_match.items()
+            if _is_hashable(value)
+        }
+        db = self._load_or_initialize()
+        if not db or not indexed:
+            yield from self._iterative_compare(comparison)
+            return
+
+        # Only the items in the smallest matching bucket can match everything
+        candidates = min(
+            (self._get_index(db, key).get(value, ())
+             for key, value in indexed.items()),
+            key=len,
+        )
+        for name in candidates:
+            doc = db[name]
+            if _matches_all(doc, items):
+                yield doc
 
     def find_range(
         self,
@@ -233,14 +451,16 @@ class JSONBackend(_Backend):
         """
 
         def comparison(name, doc):
-            if all(value == doc.get(k, _MISSING)
-                   for k, value in to_match.items()):
-                try:
-                    return start <= doc[key] < stop
-                except Exception:
-                    ...
-            return False
+            value = doc.get(key, _MISSING)
+            if value is _MISSING or not _matches_all(doc, items):
+                return False
+            try:
+                return start <= value < stop
+            except TypeError:
+                # Not comparable with a number
+                return False
 
+        items = tuple(to_match.items())
         if key in to_match:
             raise ValueError('Cannot specify the same key in `to_match` as '
                              'the key for the range.')
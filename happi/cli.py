@@ -18,6 +18,7 @@ import sys
 import time
 from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from cProfile import Profile
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
 
 import click
@@ -28,7 +29,9 @@ import happi
 from happi.errors import SearchError
 
 from .audit import (checks, find_unfilled_mandatory_info,
-                    find_unfilled_optional_info, verify_result)
+                    find_unfilled_optional_info, io_bound_checks,
+                    verify_result)
+from .loader import import_class
 from .prompt import prompt_for_entry, transfer_container
 from .utils import is_a_range, is_number, is_valid_identifier_not_keyword
 
@@ -441,10 +444,11 @@ def update(ctx, json_data: str):
     else:
         items_input = json.loads(input_)
     # insert
-    for item in items_input:
-        item = client.create_item(item["type"], **item)
-        exists = item["_id"] in [c["_id"] for c in client.all_items]
-        client._store(item, insert=not exists)
+    with client.backend.batch_context():
+        for item in items_input:
+            item = client.create_item(item["type"], **item)
+            exists = item["_id"] in [c["_id"] for c in client.all_items]
+            client._store(item, insert=not exists)
 
 
 @happi_cli.command(name='container-registry')
@@ -920,6 +924,32 @@ def pyepics_cleanup():
                     print(cache_item)
 
 
+def _verify_results_threaded(
+    results: list[happi.SearchResult],
+    check_list: list,
+) -> list[list[tuple[bool, str, str]]]:
+    """
+    Run each of ``check_list`` on every result, one result per thread.
+
+    Each result is handled by a single thread, so a device is never created
+    by two threads at once.  Returns the ``verify_result`` outcomes, in the
+    order of ``results`` and then ``check_list``.
+    """
+    # Pre-import because imports in threads have race conditions
+    for res in results:
+        try:
+            import_class(res.item.device_class)
+        except Exception:
+            # Just wait for the normal error handling later
+            pass
+
+    def verify_all(res):
+        return [verify_result(res, check_fn) for check_fn in check_list]
+
+    with ThreadPool(min(32, len(results))) as pool:
+        return pool.map(verify_all, results)
+
+
 @happi_cli.command()
 @click.pass_context
 @click.option('-f', '--file', 'ext_file',
@@ -939,6 +969,9 @@ def pyepics_cleanup():
               help='Only display names of failed entries')
 @click.option('--json', '-j', 'show_json', is_flag=True,
               help='output results in json format')
+@click.option('--threaded', '-t', 'threaded', is_flag=True,
+              help='Run checks that create and connect devices on many '
+                   'devices at once, in background threads')
 @click.argument('search_criteria', nargs=-1)
 def audit(
     ctx,
@@ -949,6 +982,7 @@ def audit(
     use_glob: bool,
     names_only: bool,
     show_json: bool,
+    threaded: bool,
     search_criteria: tuple[str, ...]
 ):
     """
@@ -965,13 +999,14 @@ def audit(
     """
     logger.debug('Starting audit block')
 
+    available_checks = dict(checks)
     # if a file is provided, make its functions available
     if ext_file:
         fp = Path(ext_file)
         sys.path.insert(1, str(fp.parent))
         ext_module = importlib.import_module(fp.stem)
         ext_checks = getattr(ext_module, 'checks')
-        checks.extend(ext_checks)
+        available_checks.update((fn.__name__, fn) for fn in ext_checks)
 
     # List checks subcommand
     if list_checks:
@@ -979,13 +1014,14 @@ def audit(
                                                         'description'])
         check_pt.hrules = prettytable.ALL
         check_pt.align['description'] = 'l'
-        for chk in checks:
-            check_pt.add_row([chk.__name__, inspect.cleandoc(chk.__doc__)])
+        for name, chk in available_checks.items():
+            check_pt.add_row([name, inspect.cleandoc(chk.__doc__)])
         print(check_pt)
         return
 
     if details:
-        check_fns = [fn for fn in checks if details in fn.__name__]
+        check_fns = [fn for name, fn in available_checks.items()
+                     if details in name]
         for fn in check_fns:
             click.echo(inspect.getsource(fn))
 
@@ -995,17 +1031,24 @@ def audit(
     if check_choices:
         check_list = []
         for check_name in check_choices:
-            # check if provided check name is a substring of any checks
-            matches = [fn for fn in checks if check_name in fn.__name__]
-            if len(matches) != 1:
-                raise click.BadParameter(
-                    f'provided check name ({check_name}) must match only'
-                    f'one check.  Matches: ({[ch.__name__ for ch in matches]})'
-                )
-            check_list.append(matches[0])
+            if check_name in available_checks:
+                fn = available_checks[check_name]
+            else:
+                # check if provided check name is a substring of any checks
+                matches = [name for name in available_checks
+                           if check_name in name]
+                if len(matches) != 1:
+                    raise click.BadParameter(
+                        f'provided check name ({check_name}) must match only'
+                        f'one check.  Matches: ({matches})'
+                    )
+                fn = available_checks[matches[0]]
+            # skip checks that were selected more than once
+            if fn not in check_list:
+                check_list.append(fn)
     else:
         # take all checks
-        check_list = checks
+        check_list = list(available_checks.values())
 
     client: happi.Client = ctx.obj
 
@@ -1015,13 +1058,28 @@ def audit(
 
     test_results = {'name': [], 'success': [], 'check': [], 'msg': []}
     f = io.StringIO()
+    # {(result index, check): outcome} for checks already run in threads
+    threaded_outcomes = {}
+    threaded_list = [fn for fn in check_list if fn in io_bound_checks]
+    if threaded and threaded_list and results:
+        logger.info('running in threads: %s',
+                    [fn.__name__ for fn in threaded_list])
+        with redirect_stderr(f), redirect_stdout(f):
+            per_result = _verify_results_threaded(results, threaded_list)
+        for i, outcomes in enumerate(per_result):
+            for check_fn, outcome in zip(threaded_list, outcomes):
+                threaded_outcomes[i, check_fn] = outcome
+
     for i, res in enumerate(results):
         if not (names_only or show_json):
             print(f'checking device #: {i}', end='\r')
         # Capture stdout, stderr for this audit
         with redirect_stderr(f), redirect_stdout(f):
             for check_fn in check_list:
-                success, check, msg = verify_result(res, check_fn)
+                if (i, check_fn) in threaded_outcomes:
+                    success, check, msg = threaded_outcomes[i, check_fn]
+                else:
+                    success, check, msg = verify_result(res, check_fn)
                 test_results['name'].append(res.item.name)
                 test_results['success'].append(success)
                 test_results['check'].append(check)
@@ -56,9 +56,23 @@ class SearchResult(collections.abc.Mapping):
     def __init__(self, client, item):
         self._item = item
         self._instantiated = None
+        self._document = None
         self.client = client
         self.metadata = item.post()
 
+    @property
+    def raw_document(self):
+        """
+        The item's document as stored in the database, before happi fills
+        in any values.  This should be treated as read-only.
+        """
+        if self._document is None:
+            id_key = self.client._id_key
+            self._document = self.client.find_document(
+                **{id_key: self[id_key]}
+            )
+        return self._document
+
     @property
     def item(self):
         if self._item is None:
@@ -487,11 +501,14 @@ class Client(collections.abc.Mapping):
     def __getitem__(self, key):
         """Get an item ID."""
         try:
-            item = self._get_item_from_document(self.backend.get_by_id(key))
+            doc = self.backend.get_by_id(key)
+            item = self._get_item_from_document(doc)
         except Exception as ex:
             raise KeyError(key) from ex
 
-        return SearchResult(client=self, item=item)
+        result = SearchResult(client=self, item=item)
+        result._document = doc
+        return result
 
     def __iter__(self):
         for info in self.backend.find({}):
@@ -517,12 +534,13 @@ class Client(collections.abc.Mapping):
         results = []
         for doc in docs:
             try:
-                results.append(
-                    wrap_cls(
-                        client=self,
-                        item=self._get_item_from_document(doc)
-                    )
+                result = wrap_cls(
+                    client=self,
+                    item=self._get_item_from_document(doc)
                 )
+                # Keep the document to spare a lookup for ``raw_document``
+                result._document = doc
+                results.append(result)
             except Exception as exc:
                 logger.warning(
                     "Entry for %s is malformed (%s). Skipping.",
@@ -754,12 +772,13 @@ class Client(collections.abc.Mapping):
         # In case we want to update the name of an entry
         # We want to add a new entry, and delete the old one
         if the_old_name and the_old_name != post[self._id_key]:
-            # Store information for the new entry
-            logger.info('Saving new entry %s ...', _id)
-            self.backend.save(_id, post, insert=True)
-            # Remove the information for the old entry
-            logger.info('Removing old entry %s ...', the_old_name)
-            self.backend.delete(the_old_name)
+            with self.backend.batch_context():
+                # Store information for the new entry
+                logger.info('Saving new entry %s ...', _id)
+                self.backend.save(_id, post, insert=True)
+                # Remove the information for the old entry
+                logger.info('Removing old entry %s ...', the_old_name)
+                self.backend.delete(the_old_name)
         else:
             # Store information
             logger.info('Adding / Modifying information for %s ...', _id)
@@ -1,9 +1,13 @@
+import inspect
+import json
 import re
 
 import pytest
 from click.testing import CliRunner
 
 import happi
+from happi.audit import (CLIENT_KEYS, check_extra_info, checks,
+                         verify_result)
 from happi.cli import happi_cli
 
 
@@ -40,3 +44,96 @@ def test_audit_cli(
     # check that device failed
     print(res.output)
     assert number_failed_devices(res.output) == n_fails
+
+
+@pytest.mark.parametrize("n_fails, check", [
+    (4, "check_instantiation"),
+    (1, "check_name_match_id"),
+])
+def test_audit_cli_threaded(
+    runner: CliRunner,
+    bad_happi_cfg: str,
+    n_fails: int,
+    check: str
+):
+    res = runner.invoke(happi_cli, ['--path', bad_happi_cfg, 'audit',
+                                    '--threaded', '-c', check, '*'])
+    assert number_failed_devices(res.output) == n_fails
+
+
+def test_audit_cli_ext_file(
+    runner: CliRunner,
+    bad_happi_cfg: str,
+    tmp_path
+):
+    ext_file = tmp_path / 'happi_ext_checks.py'
+    ext_file.write_text(
+        'def check_always_fails(result):\n'
+        '    """Fail every item."""\n'
+        '    raise ValueError("failed")\n'
+        '\n'
+        'checks = [check_always_fails]\n'
+    )
+    res = runner.invoke(happi_cli, ['--path', bad_happi_cfg, 'audit',
+                                    '-f', str(ext_file), '--list'])
+    assert 'check_always_fails' in res.output
+    assert 'check_name_match_id' in res.output
+
+    # Selecting a check twice runs it once
+    res = runner.invoke(happi_cli, ['--path', bad_happi_cfg, 'audit',
+                                    '-f', str(ext_file), '--json',
+                                    '-c', 'check_always_fails',
+                                    '-c', 'always_fails', '*'])
+    # skip any log messages preceding the report
+    report = json.loads(res.output[res.output.index('{'):])
+    items = report['items']
+    assert items
+    for info in items.values():
+        assert info['failed_check'] == ['check_always_fails']
+
+
+@pytest.mark.parametrize("check", list(checks.values()))
+def test_builtin_check_signature(check):
+    # verify_result relies on this rather than binding at runtime
+    inspect.signature(check).bind(object())
+
+
+def test_verify_result_unhashable_check(client: happi.Client):
+    class UnhashableCheck:
+        """A check defining __eq__, and so not __hash__."""
+        __name__ = 'unhashable_check'
+
+        def __eq__(self, other):
+            return self is other
+
+        def __call__(self, result):
+            raise ValueError(result['name'])
+
+    res = client.search()[0]
+    assert verify_result(res, UnhashableCheck()) == (
+        False, 'unhashable_check', res['name']
+    )
+
+
+def test_check_extra_info_ignore_keys(client: happi.Client):
+    res = client.search(name='tst_extra_info')[0]
+    with pytest.raises(ValueError, match='extra_info'):
+        check_extra_info(res)
+    # Any iterable of keys may be ignored, in place of the client keys
+    check_extra_info(res, ignore_keys=iter(CLIENT_KEYS | {'extra_info'}))
+    with pytest.raises(ValueError, match='_id'):
+        check_extra_info(res, ignore_keys=('extra_info',))
+
+
+def test_audit_shared_id(runner: CliRunner, tmp_path):
+    # Entries whose ``_id`` field repeats are audited separately
+    db_path = tmp_path / 'dup_db.json'
+    db_path.write_text(json.dumps({
+        'k1': {'_id': 'dup', 'name': 'dup', 'type': 'HappiItem'},
+        'k2': {'_id': 'dup', 'name': 'other_name', 'type': 'HappiItem'},
+    }))
+    cfg_path = tmp_path / 'dup.cfg'
+    cfg_path.write_text(f'[DEFAULT]\nbackend=json\npath={db_path}\n')
+    res = runner.invoke(happi_cli, ['--path', str(cfg_path), 'audit',
+                                    '-c', 'check_name_match_id', '*'])
+    assert number_failed_devices(res.output) == 1
@@ -2,6 +2,7 @@ import os
 import os.path
 import tempfile
 from typing import Any
+from unittest import mock
 
 import pytest
 import simplejson
@@ -139,6 +140,35 @@ def test_json_find(
     # Multiple items expected
     assert all(info in find(beamline='LCLS')
                for info in (item_info, valve_info))
+    # Multiple keys, and unhashable values that cannot use the index
+    assert [item_info] == find(beamline='LCLS', _id=item_info['_id'])
+    assert find(beamline='LCLS', _id='nomatch') == []
+    assert [item_info] == find(kwargs=item_info['kwargs'])
+    assert [item_info] == find(kwargs=item_info['kwargs'], beamline='LCLS')
+    # Indices are refreshed after a write
+    mm.save(valve_info['_id'], {'beamline': 'BLERG'}, insert=False)
+    assert find(beamline='BLERG') == [dict(valve_info, beamline='BLERG')]
+    valve_info['beamline'] = 'BLERG'
+
+    # Values that compare equal share a bucket, as 1 == 1.0 == True
+    mm.save(valve_info['_id'], {'z': 1, 'active': True}, insert=False)
+    valve_info.update(z=1, active=True)
+    assert find(z=True) == [valve_info]
+    assert find(z=1.0) == [valve_info]
+    assert find(active=1) == [valve_info]
+    assert find(z=1, active=1.0) == [valve_info]
+    assert find(z=0) == []
+
+    # Reads inside a batch see its modifications before they are written
+    with mm.batch_context():
+        mm.delete(item_info['_id'])
+        assert find(_id=item_info['_id']) == []
+        assert find(beamline='LCLS') == []
+        new_info = dict(item_info, _id='new', name='new', z=1)
+        mm.save('new', new_info, insert=True)
+        assert find(_id='new') == [new_info]
+        assert find(z=1) == [valve_info, new_info]
+    assert find(z=1) == [valve_info, new_info]
 
 
 def test_find_regex(client_with_three_valves, three_valves):
@@ -190,6 +220,176 @@ def test_json_initialize():
     os.remove("testing.json")
 
 
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_json_store_load_roundtrip(
+    monkeypatch: pytest.MonkeyPatch,
+    item_info: dict[str, Any],
+    valve_info: dict[str, Any],
+    use_orjson: bool,
+):
+    from happi.backends import json_db
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(json_db, 'orjson', None)
+
+    db = {valve_info['_id']: valve_info, item_info['_id']: item_info}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        jb = JSONBackend(os.path.join(tmpdir, 'db.json'), initialize=True)
+        jb.store(db)
+        assert jb.load() == db
+        # The stored file is plain, sorted JSON readable by any parser
+        with open(jb.path) as fd:
+            on_disk = simplejson.load(fd)
+        assert on_disk == db
+        assert list(on_disk) == sorted(db)
+
+
+def test_json_dumps_fallback_matches_orjson(
+    monkeypatch: pytest.MonkeyPatch,
+    item_info: dict[str, Any],
+    valve_info: dict[str, Any],
+):
+    pytest.importorskip('orjson')
+    from happi.backends import json_db
+
+    db = {valve_info['_id']: valve_info,
+          item_info['_id']: dict(item_info, location_group='Hütch 1 / 2',
+                                 z=1.5, active=True, blank=None)}
+    exponents = {'item': {'big': 1e16, 'small': 1e-7}}
+    big_int = {'item': {'value': 2 ** 64}}
+    with_orjson = [json_db._dumps(data) for data in (db, exponents, big_int)]
+    monkeypatch.setattr(json_db, 'orjson', None)
+    fallback = [json_db._dumps(data) for data in (db, exponents, big_int)]
+    assert fallback[0] == with_orjson[0]
+
+    # Exponents are written differently, but read back the same
+    assert b'1e16' in with_orjson[1] and b'1e+16' in fallback[1]
+    assert b'1e-7' in with_orjson[1] and b'1e-07' in fallback[1]
+    for raw in with_orjson[1], fallback[1]:
+        assert simplejson.loads(raw) == exponents
+
+    # Integers orjson can not write are written by simplejson instead
+    assert with_orjson[2] == fallback[2]
+    assert json_db._loads(fallback[2]) == big_int
+
+
+def test_json_parse_cache(mockjson, item_info: dict[str, Any], valve_info):
+    from happi.backends import json_db
+    first = mockjson.load()
+    # Unchanged on disk: the file is not read again
+    with mock.patch.object(json_db, 'open', side_effect=OSError,
+                           create=True):
+        mockjson.clear_cache()
+        assert mockjson.load() == first
+        # ... but each load parses a separate copy
+        assert mockjson.load() is not first
+
+    # Modified by another writer: the file is parsed again
+    other = JSONBackend(mockjson.path)
+    other.save(valve_info[Client._id_key], valve_info, insert=True)
+    mockjson.clear_cache()
+    assert valve_info in mockjson.all_items
+
+    # A failed write does not leave stale data in the cache
+    with pytest.raises(DuplicateError):
+        mockjson.save(item_info[Client._id_key], item_info, insert=True)
+    assert mockjson.load() == other.load()
+
+
+def test_json_batch_context(mockjson, item_info: dict[str, Any], valve_info):
+    from happi.backends import json_db
+    on_disk = JSONBackend(mockjson.path)
+    with mockjson.batch_context():
+        mockjson.save(valve_info[Client._id_key], valve_info, insert=True)
+        mockjson.delete(item_info[Client._id_key])
+        # Modifications are visible, but not yet written
+        assert mockjson.all_items == [valve_info]
+        assert list(mockjson.find({'_id': valve_info['_id']})) == [valve_info]
+        assert on_disk.load() == {item_info['_id']: item_info}
+
+    assert on_disk.load() == {valve_info['_id']: valve_info}
+
+    # Successful modifications are written even if the block fails
+    with pytest.raises(DuplicateError):
+        with mockjson.batch_context():
+            mockjson.save(item_info[Client._id_key], item_info, insert=True)
+            mockjson.save(item_info[Client._id_key], item_info, insert=True)
+    assert item_info in on_disk.load().values()
+
+    # Modifications that fail to be written are not kept in memory either
+    before = on_disk.load()
+    with pytest.raises(TypeError):
+        with mockjson.batch_context():
+            mockjson.save('bad', {'v': object()}, insert=True)
+    assert mockjson.load() == before
+    assert mockjson.all_items == list(before.values())
+
+    # Nor are those of a modification that fails part-way in a batch
+    with pytest.raises(SearchError):
+        with mockjson.batch_context():
+            with json_db._load_and_store_context(mockjson) as db:
+                db['bad'] = {'_id': 'bad'}
+                raise SearchError('failed part-way')
+    assert mockjson.load() == before
+
+
+def test_json_store_unserializable(mockjson, item_info: dict[str, Any]):
+    with pytest.raises(TypeError):
+        mockjson.store({'bad': {'_id': 'bad', 'value': object()}})
+    # Neither the database nor its directory were touched
+    assert JSONBackend(mockjson.path).load() == {item_info['_id']: item_info}
+    directory = os.path.dirname(mockjson.path)
+    assert not any(os.path.basename(mockjson.path) in fn
+                   and fn.startswith('.')
+                   for fn in os.listdir(directory))
+
+
+def test_json_iterative_compare_errors(mockjson, item_info, valve_info):
+    mockjson.save(valve_info[Client._id_key], valve_info, insert=True)
+
+    def comparison(name, doc):
+        if name == item_info['_id']:
+            raise RuntimeError('comparison failed')
+        return True
+
+    # A failed comparison skips only that document
+    assert list(mockjson._iterative_compare(comparison)) == [valve_info]
+
+    # Errors from iterating over the database itself are not swallowed
+    results = mockjson._iterative_compare(lambda name, doc: True)
+    next(results)
+    mockjson._load_or_initialize()['new_item'] = {'_id': 'new_item'}
+    with pytest.raises(RuntimeError):
+        next(results)
+
+    # Values that can not be compared with a number are not in range
+    mockjson.save(valve_info[Client._id_key], {'z': 'high'}, insert=False)
+    assert list(mockjson.find_range('z', start=0, to_match={})) == [item_info]
+
+
+def test_json_edited_documents_not_kept(mockjson, item_info, valve_info):
+    _id = item_info['_id']
+    # Editing returned documents in place does not change the database
+    # once the cache is cleared
+    next(mockjson.find({'_id': _id}))['name'] = 'scratch-edit'
+    mockjson.all_items[0]['name'] = 'scratch-edit'
+    mockjson.get_by_id(_id)['kwargs']['hi'] = 'scratch-edit'
+    mockjson.clear_cache()
+    post = dict(valve_info)
+    mockjson.save(valve_info['_id'], post, insert=True)
+    post['name'] = 'scratch-edit'
+    mockjson.clear_cache()
+    assert list(mockjson.find({'_id': _id})) == [item_info]
+    assert mockjson.get_by_id(valve_info['_id']) == valve_info
+
+    # ... nor does an unrelated write store those edits
+    mockjson.save('other', {'name': 'other'}, insert=True)
+    on_disk = JSONBackend(mockjson.path).load()
+    assert on_disk[_id] == item_info
+    assert on_disk[valve_info['_id']] == valve_info
+
+
 def test_json_tempfile_location():
     jb = JSONBackend("testing.json", initialize=False)
     assert os.path.dirname(jb.path) == os.path.dirname(jb._temp_path())
@@ -203,6 +403,45 @@ def test_json_tempfile_uniqueness():
     assert len(set(tempfiles)) == len(tempfiles)
 
 
+@pytest.fixture(scope='function')
+def stub_qsbackend(monkeypatch, item_info, valve_info):
+    """A QSBackend serving two items, not needing ``psdm_qs_cli``."""
+    import sys
+    import types
+
+    class QuestionnaireClient:
+        def __init__(self, **kwargs):
+            ...
+
+    monkeypatch.setitem(
+        sys.modules, 'psdm_qs_cli',
+        types.SimpleNamespace(QuestionnaireClient=QuestionnaireClient)
+    )
+    monkeypatch.delitem(sys.modules, 'happi.backends.qs_db', raising=False)
+    from happi.backends.qs_db import QSBackend
+
+    def initialize_database(self, experiment):
+        return {item_info['_id']: item_info, valve_info['_id']: valve_info}
+
+    monkeypatch.setattr(QSBackend, '_initialize_database',
+                        initialize_database)
+    return QSBackend('tstlr3216')
+
+
+def test_qs_stub_read(stub_qsbackend, item_info, valve_info):
+    assert stub_qsbackend.all_items == [item_info, valve_info]
+    assert stub_qsbackend.get_by_id(valve_info['_id']) == valve_info
+    assert list(stub_qsbackend.find({'_id': valve_info['_id']})) == [
+        valve_info
+    ]
+    assert list(stub_qsbackend.find({'beamline': 'LCLS'})) == [
+        item_info, valve_info
+    ]
+    assert list(stub_qsbackend.find_regex({'_id': item_info['_id']})) == [
+        item_info
+    ]
+
+
 @requires_questionnaire
 def test_qs_find(mockqsbackend):
     assert len(list(mockqsbackend.find(dict(beamline='TST')))) == 14
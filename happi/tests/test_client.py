@@ -184,6 +184,21 @@ def test_search(
     assert len(res) == 2
 
 
+def test_search_result_raw_document(
+    happi_client: Client,
+    item_info: dict[str, Any]
+):
+    expected = happi_client.find_document(name=item_info['name'])
+    # Document kept from the search
+    res = happi_client.search(name=item_info['name'])[0]
+    assert res.raw_document == expected
+    # Document kept from the lookup by id
+    assert happi_client[item_info['_id']].raw_document == expected
+    # Document fetched on request
+    res._document = None
+    assert res.raw_document == expected
+
+
 def test_search_range(happi_client: Client, valve: OphydItem):
     happi_client.add_item(valve)
     # Search between two points